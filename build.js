@@ -12,6 +12,9 @@ const srcContent = fs.readFileSync(srcPath, 'utf8');
 
 // Remove TypeScript-specific syntax (simplified - for production use a real transpiler)
 let jsContent = srcContent
+  // Strip the FileToTextConverter return type first, before ': File' eats
+  // its leading 'File' and leaves 'ToTextConverter' behind
+  .replace(/\)\s*:\s*FileToTextConverter\s*\{/g, ') {')
   // Remove type annotations
   .replace(/:\s*FileToTextOptions/g, '')
   .replace(/:\s*Required<FileToTextOptions>/g, '')
@@ -1,14 +1,46 @@
+// Lookup tables shared by every instance; built once when the module loads
+const STREET_TYPES = ['Street', 'St', 'Avenue', 'Ave', 'Boulevard', 'Blvd', 'Drive', 'Dr', 'Lane', 'Ln', 'Road', 'Rd'];
+const US_STATES = ['AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA', 'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY'];
+const US_STATES_FULL = ['Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado', 'Connecticut', 'Delaware', 'Florida', 'Georgia'];
+const COUNTRIES = ['United Kingdom', 'UK', 'Canada', 'Germany', 'France', 'Japan'];
+
+// Each detectInternationalAddresses loop resets lastIndex before using these
+const COUNTRY_PATTERNS = COUNTRIES.map(country => ({
+  country,
+  pattern: new RegExp(`\\b${country}\\b`, 'gi')
+}));
+
+const STREET_TYPE_STANDARDIZATION = {
+  'St': 'Street', 'Ave': 'Avenue', 'Blvd': 'Boulevard', 'Dr': 'Drive',
+  'Ln': 'Lane', 'Rd': 'Road', 'Ct': 'Court', 'Pl': 'Place'
+};
+
+let sharedAddressService = null;
+
 export class AddressDetectionService {
   constructor() {
     this.initializePatterns();
     this.initializeStandardizations();
+    
+    // Most recent input and its detections, reused when the same text is scanned again
+    this.lastDetection = null;
+  }
+
+  /**
+   * Lazily created instance shared by the redactors, so they don't each build their own
+   */
+  static getShared() {
+    if (!sharedAddressService) {
+      sharedAddressService = new AddressDetectionService();
+    }
+    return sharedAddressService;
   }
 
   initializePatterns() {
     // Simplified patterns to avoid infinite loops
-    this.streetTypes = ['Street', 'St', 'Avenue', 'Ave', 'Boulevard', 'Blvd', 'Drive', 'Dr', 'Lane', 'Ln', 'Road', 'Rd'];
-    this.states = ['AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA', 'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY'];
-    this.statesFull = ['Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado', 'Connecticut', 'Delaware', 'Florida', 'Georgia'];
+    this.streetTypes = STREET_TYPES;
+    this.states = US_STATES;
+    this.statesFull = US_STATES_FULL;
     
     // Simple, reliable patterns - updated to handle units
     this.fullAddressPattern = /(\d{1,5}[A-Z]?(?:-\d{1,5})?)\s+([A-Za-z]+(?:\s+[A-Za-z]+)*)\s+(Street|St|Avenue|Ave|Boulevard|Blvd|Drive|Dr|Lane|Ln|Road|Rd|Court|Ct|Place|Pl|Way)(?:\s+(Apt|Unit|Suite|Ste|#)\s*([A-Za-z0-9-]+))?,?\s*([A-Za-z\s]+),?\s*([A-Z]{2})\s+(\d{5}(?:-\d{4})?)/g;
@@ -18,16 +50,17 @@ export class AddressDetectionService {
     // More specific pattern for city names - exclude prepositions
     this.cityOnlyPattern = /\b([A-Za-z]+(?:\s+[A-Za-z]+)*),\s+(Alabama|Alaska|Arizona|Arkansas|California|Colorado|Connecticut|Delaware|Florida|Georgia|Hawaii|Idaho|Illinois|Indiana|Iowa|Kansas|Kentucky|Louisiana|Maine|Maryland|Massachusetts|Michigan|Minnesota|Mississippi|Missouri|Montana|Nebraska|Nevada|New Hampshire|New Jersey|New Mexico|New York|North Carolina|North Dakota|Ohio|Oklahoma|Oregon|Pennsylvania|Rhode Island|South Carolina|South Dakota|Tennessee|Texas|Utah|Vermont|Virginia|Washington|West Virginia|Wisconsin|Wyoming)\b/g;
     this.zipPattern = /\b(\d{5}(?:-\d{4})?)\b/g;
-    this.countries = ['United Kingdom', 'UK', 'Canada', 'Germany', 'France', 'Japan'];
+    this.cityStateZipPattern = /^[,\s]*([A-Za-z\s]+?)[,\s]+(AL|AK|AZ|AR|CA|CO|CT|DE|FL|GA|HI|ID|IL|IN|IA|KS|KY|LA|ME|MD|MA|MI|MN|MS|MO|MT|NE|NV|NH|NJ|NM|NY|NC|ND|OH|OK|OR|PA|RI|SC|SD|TN|TX|UT|VT|VA|WA|WV|WI|WY)\s+(\d{5}(?:-\d{4})?)/;
+    this.countries = COUNTRIES;
+    this.countryPatterns = COUNTRY_PATTERNS;
+    // Phone numbers, SSNs and dates that the street patterns can mistake for addresses
+    this.phoneOrSSNPattern = /\b\d{3}-\d{3}-\d{4}\b|\(\d{3}\)\s?\d{3}-?\d{4}|\b\d{3}-\d{2}-\d{4}\b|\b\d{1,2}\/\d{1,2}\/\d{2,4}\b/;
     this.ukPostalPattern = /\b([A-Z]{1,2}\d[A-Z0-9]?\s?\d[A-Z]{2})\b/g;
     this.canadianPostalPattern = /\b([A-Z]\d[A-Z]\s?\d[A-Z]\d)\b/g;
   }
 
   initializeStandardizations() {
-    this.streetTypeStandardization = {
-      'St': 'Street', 'Ave': 'Avenue', 'Blvd': 'Boulevard', 'Dr': 'Drive',
-      'Ln': 'Lane', 'Rd': 'Road', 'Ct': 'Court', 'Pl': 'Place'
-    };
+    this.streetTypeStandardization = STREET_TYPE_STANDARDIZATION;
   }
 
   detectAddresses(text) {
@@ -39,6 +72,11 @@ export class AddressDetectionService {
       return [];
     }
 
+    // Re-tokenizing the same document (e.g. flipping the address toggle) skips the rescan
+    if (this.lastDetection && this.lastDetection.text === text) {
+      return this.copyResults(this.lastDetection.results);
+    }
+
     const results = [];
     
     // Detect full US addresses
@@ -59,7 +97,17 @@ export class AddressDetectionService {
       }
     }
     
-    return this.deduplicateAndSort(results);
+    const detected = this.deduplicateAndSort(results);
+    this.lastDetection = { text, results: detected };
+    
+    return this.copyResults(detected);
+  }
+
+  /**
+   * Copy cached results so callers can sort or edit them freely
+   */
+  copyResults(results) {
+    return results.map(result => ({ ...result, components: { ...result.components } }));
   }
 
   detectFullUSAddresses(text) {
@@ -126,7 +174,8 @@ export class AddressDetectionService {
       
       // Look for city, state, zip after PO Box
       const remainingText = text.slice(match.index + fullMatch.length);
-      const cityStateZip = this.extractCityStateZip(remainingText);
+      const cityStateZipMatch = remainingText.match(this.cityStateZipPattern);
+      const cityStateZip = this.parseCityStateZip(cityStateZipMatch);
       
       const components = {
         poBox: poBoxNumber,
@@ -136,12 +185,10 @@ export class AddressDetectionService {
       let originalText = fullMatch;
       let endIndex = startIndex + fullMatch.length;
       
+      // The city/state/zip match already spans exactly the text to absorb
       if (cityStateZip.city) {
-        const cityMatch = remainingText.match(new RegExp(`^[,\\s]*${cityStateZip.city}[,\\s]*${cityStateZip.state}\\s+${cityStateZip.zipCode}`));
-        if (cityMatch) {
-          originalText += cityMatch[0];
-          endIndex += cityMatch[0].length;
-        }
+        originalText += cityStateZipMatch[0];
+        endIndex += cityStateZipMatch[0].length;
       }
       
       results.push({
@@ -267,8 +314,8 @@ export class AddressDetectionService {
   detectInternationalAddresses(text) {
     const results = [];
     
-    for (const country of this.countries) {
-      const countryPattern = new RegExp(`\\b${country}\\b`, 'gi');
+    for (const { country, pattern: countryPattern } of this.countryPatterns) {
+      countryPattern.lastIndex = 0;
       let match;
       
       while ((match = countryPattern.exec(text)) !== null) {
@@ -296,9 +343,10 @@ export class AddressDetectionService {
   parseInternationalAddress(context, country) {
     const components = { country };
     let hasAddressIndicators = false;
+    const lowerCountry = country.toLowerCase();
     
     // Check for postal codes with better patterns
-    if (country.toLowerCase().includes('uk') || country.toLowerCase().includes('kingdom')) {
+    if (lowerCountry.includes('uk') || lowerCountry.includes('kingdom')) {
       // UK postal code: SW1A 2AA format
       const ukMatch = context.match(/\b([A-Z]{1,2}\d[A-Z0-9]?\s\d[A-Z]{2})\b/);
       if (ukMatch) {
@@ -307,7 +355,7 @@ export class AddressDetectionService {
       }
     }
     
-    if (country.toLowerCase().includes('canada')) {
+    if (lowerCountry.includes('canada')) {
       // Canadian postal code: M5V 3A8 format
       const canMatch = context.match(/\b([A-Z]\d[A-Z]\s\d[A-Z]\d)\b/);
       if (canMatch) {
@@ -331,8 +379,10 @@ export class AddressDetectionService {
   }
 
   extractCityStateZip(text) {
-    const match = text.match(/^[,\s]*([A-Za-z\s]+?)[,\s]+(AL|AK|AZ|AR|CA|CO|CT|DE|FL|GA|HI|ID|IL|IN|IA|KS|KY|LA|ME|MD|MA|MI|MN|MS|MO|MT|NE|NV|NH|NJ|NM|NY|NC|ND|OH|OK|OR|PA|RI|SC|SD|TN|TX|UT|VT|VA|WA|WV|WI|WY)\s+(\d{5}(?:-\d{4})?)/);
-    
+    return this.parseCityStateZip(text.match(this.cityStateZipPattern));
+  }
+
+  parseCityStateZip(match) {
     if (match) {
       return {
         city: match[1].trim(),
@@ -390,22 +440,17 @@ export class AddressDetectionService {
   }
 
   looksLikePhoneOrSSN(text) {
-    if (/\b\d{3}-\d{3}-\d{4}\b/.test(text)) return true;
-    if (/\(\d{3}\)\s?\d{3}-?\d{4}/.test(text)) return true;
-    if (/\b\d{3}-\d{2}-\d{4}\b/.test(text)) return true;
-    if (/\b\d{1,2}\/\d{1,2}\/\d{2,4}\b/.test(text)) return true;
-    return false;
+    return this.phoneOrSSNPattern.test(text);
   }
 
   deduplicateAndSort(results) {
     const filtered = [];
     
     for (const result of results) {
-      const overlapping = filtered.find(existing => this.isOverlapping(result, existing));
+      const index = filtered.findIndex(existing => this.isOverlapping(result, existing));
       
-      if (overlapping) {
-        if (result.confidence > overlapping.confidence) {
-          const index = filtered.indexOf(overlapping);
+      if (index !== -1) {
+        if (result.confidence > filtered[index].confidence) {
           filtered[index] = result;
         }
       } else {
@@ -1,5 +1,103 @@
 import { FileToTextConverter } from '../dist/FileToTextConverter.esm.js';
 
+// Static markup for each wizard step
+const WELCOME_STEP_HTML = `
+  <div class="step-icon">🚀</div>
+  <h2>Transform Your Career</h2>
+  <p>Upload your resume and get AI-powered insights to accelerate your career growth.</p>
+  <div class="features">
+    <div class="feature">
+      <span class="feature-icon">📱</span>
+      <span>Mobile Optimized</span>
+    </div>
+    <div class="feature">
+      <span class="feature-icon">🔒</span>
+      <span>Privacy First</span>
+    </div>
+    <div class="feature">
+      <span class="feature-icon">⚡</span>
+      <span>Instant Results</span>
+    </div>
+  </div>
+`;
+
+const QUESTIONNAIRE_STEP_HTML = `
+  <h2>Tell us about your career goals</h2>
+  <form class="questionnaire-form">
+    <div class="form-group">
+      <label for="currentRole">Current Role</label>
+      <input type="text" id="currentRole" name="currentRole" placeholder="e.g., Software Engineer">
+    </div>
+    <div class="form-group">
+      <label for="targetRole">Target Role</label>
+      <input type="text" id="targetRole" name="targetRole" placeholder="e.g., Senior Software Engineer">
+    </div>
+    <div class="form-group">
+      <label for="experience">Years of Experience</label>
+      <select id="experience" name="experience">
+        <option value="">Select...</option>
+        <option value="0-1">0-1 years</option>
+        <option value="2-3">2-3 years</option>
+        <option value="4-5">4-5 years</option>
+        <option value="6-10">6-10 years</option>
+        <option value="10+">10+ years</option>
+      </select>
+    </div>
+    <div class="form-group">
+      <label for="industry">Industry</label>
+      <select id="industry" name="industry">
+        <option value="">Select...</option>
+        <option value="tech">Technology</option>
+        <option value="finance">Finance</option>
+        <option value="healthcare">Healthcare</option>
+        <option value="education">Education</option>
+        <option value="other">Other</option>
+      </select>
+    </div>
+    <div class="form-group">
+      <label for="goals">Career Goals</label>
+      <textarea id="goals" name="goals" placeholder="What are your main career objectives?"></textarea>
+    </div>
+  </form>
+`;
+
+const UPLOAD_STEP_HTML = `
+  <h2>Upload Your Resume</h2>
+  <div class="upload-container">
+    <div class="upload-area" id="uploadArea">
+      <div class="upload-icon">📄</div>
+      <p class="upload-text">Tap to select or drag your resume here</p>
+      <p class="upload-subtext">Supports PDF, Word, and text files</p>
+      <input type="file" id="fileInput" accept=".pdf,.doc,.docx,.txt,.md" hidden>
+    </div>
+    <div class="upload-progress" id="uploadProgress" style="display: none;">
+      <div class="progress-bar">
+        <div class="progress-fill" id="progressFill"></div>
+      </div>
+      <div class="progress-text" id="progressText"></div>
+    </div>
+    <div class="upload-result" id="uploadResult" style="display: none;"></div>
+  </div>
+`;
+
+const REVIEW_STEP_HTML = `
+  <h2>Review Your Information</h2>
+  <div class="review-content">
+    <div class="review-section">
+      <h3>Career Profile</h3>
+      <div id="careerProfile"></div>
+    </div>
+    <div class="review-section">
+      <h3>Resume Analysis</h3>
+      <div id="resumeAnalysis"></div>
+    </div>
+    <div class="review-section">
+      <h3>Extracted Text Preview</h3>
+      <div id="textPreview"></div>
+    </div>
+  </div>
+`;
+
 export class CareerWizard {
   constructor(container, options = {}) {
     this.container = container;
@@ -55,122 +153,38 @@ export class CareerWizard {
         getData: () => this.wizardData
       }
     ];
+    
+    // Step markup never changes, so serialize it once rather than on every render
+    this.steps.forEach(step => {
+      step.markup = step.component.outerHTML;
+    });
   }
 
   createWelcomeStep() {
     const step = document.createElement('div');
     step.className = 'wizard-step welcome-step';
-    step.innerHTML = `
-      <div class="step-icon">🚀</div>
-      <h2>Transform Your Career</h2>
-      <p>Upload your resume and get AI-powered insights to accelerate your career growth.</p>
-      <div class="features">
-        <div class="feature">
-          <span class="feature-icon">📱</span>
-          <span>Mobile Optimized</span>
-        </div>
-        <div class="feature">
-          <span class="feature-icon">🔒</span>
-          <span>Privacy First</span>
-        </div>
-        <div class="feature">
-          <span class="feature-icon">⚡</span>
-          <span>Instant Results</span>
-        </div>
-      </div>
-    `;
+    step.innerHTML = WELCOME_STEP_HTML;
     return step;
   }
 
   createQuestionnaireStep() {
     const step = document.createElement('div');
     step.className = 'wizard-step questionnaire-step';
-    step.innerHTML = `
-      <h2>Tell us about your career goals</h2>
-      <form class="questionnaire-form">
-        <div class="form-group">
-          <label for="currentRole">Current Role</label>
-          <input type="text" id="currentRole" name="currentRole" placeholder="e.g., Software Engineer">
-        </div>
-        <div class="form-group">
-          <label for="targetRole">Target Role</label>
-          <input type="text" id="targetRole" name="targetRole" placeholder="e.g., Senior Software Engineer">
-        </div>
-        <div class="form-group">
-          <label for="experience">Years of Experience</label>
-          <select id="experience" name="experience">
-            <option value="">Select...</option>
-            <option value="0-1">0-1 years</option>
-            <option value="2-3">2-3 years</option>
-            <option value="4-5">4-5 years</option>
-            <option value="6-10">6-10 years</option>
-            <option value="10+">10+ years</option>
-          </select>
-        </div>
-        <div class="form-group">
-          <label for="industry">Industry</label>
-          <select id="industry" name="industry">
-            <option value="">Select...</option>
-            <option value="tech">Technology</option>
-            <option value="finance">Finance</option>
-            <option value="healthcare">Healthcare</option>
-            <option value="education">Education</option>
-            <option value="other">Other</option>
-          </select>
-        </div>
-        <div class="form-group">
-          <label for="goals">Career Goals</label>
-          <textarea id="goals" name="goals" placeholder="What are your main career objectives?"></textarea>
-        </div>
-      </form>
-    `;
+    step.innerHTML = QUESTIONNAIRE_STEP_HTML;
     return step;
   }
 
   createUploadStep() {
     const step = document.createElement('div');
     step.className = 'wizard-step upload-step';
-    step.innerHTML = `
-      <h2>Upload Your Resume</h2>
-      <div class="upload-container">
-        <div class="upload-area" id="uploadArea">
-          <div class="upload-icon">📄</div>
-          <p class="upload-text">Tap to select or drag your resume here</p>
-          <p class="upload-subtext">Supports PDF, Word, and text files</p>
-          <input type="file" id="fileInput" accept=".pdf,.doc,.docx,.txt,.md" hidden>
-        </div>
-        <div class="upload-progress" id="uploadProgress" style="display: none;">
-          <div class="progress-bar">
-            <div class="progress-fill" id="progressFill"></div>
-          </div>
-          <div class="progress-text" id="progressText"></div>
-        </div>
-        <div class="upload-result" id="uploadResult" style="display: none;"></div>
-      </div>
-    `;
+    step.innerHTML = UPLOAD_STEP_HTML;
     return step;
   }
 
   createReviewStep() {
     const step = document.createElement('div');
     step.className = 'wizard-step review-step';
-    step.innerHTML = `
-      <h2>Review Your Information</h2>
-      <div class="review-content">
-        <div class="review-section">
-          <h3>Career Profile</h3>
-          <div id="careerProfile"></div>
-        </div>
-        <div class="review-section">
-          <h3>Resume Analysis</h3>
-          <div id="resumeAnalysis"></div>
-        </div>
-        <div class="review-section">
-          <h3>Extracted Text Preview</h3>
-          <div id="textPreview"></div>
-        </div>
-      </div>
-    `;
+    step.innerHTML = REVIEW_STEP_HTML;
     return step;
   }
 
@@ -190,7 +204,7 @@ export class CareerWizard {
         
         <div class="wizard-content">
           <div class="step-container" id="stepContainer">
-            ${this.steps[this.currentStep].component.outerHTML}
+            ${this.steps[this.currentStep].markup}
           </div>
         </div>
         
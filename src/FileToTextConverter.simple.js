@@ -36,6 +36,15 @@ export class FileToTextConverter {
   }
 
   async readTextFile(file) {
+    // Blob.text() is a promise-based read, no FileReader event wiring needed
+    if (typeof file.text === 'function') {
+      try {
+        return await file.text();
+      } catch (error) {
+        throw new Error('Failed to read file', { cause: error });
+      }
+    }
+
     return new Promise((resolve, reject) => {
       const reader = new FileReader();
       reader.onload = (e) => resolve(e.target.result);
@@ -55,21 +64,22 @@ export class FileToTextConverter {
       const loadingTask = pdfjsLib.getDocument({ data: arrayBuffer });
       const pdf = await loadingTask.promise;
       
-      let fullText = '';
       const numPages = pdf.numPages;
       
-      // Extract text from each page
-      for (let pageNum = 1; pageNum <= numPages; pageNum++) {
-        const page = await pdf.getPage(pageNum);
-        const textContent = await page.getTextContent();
-        
-        // Combine text items into a single string
-        const pageText = textContent.items
-          .map(item => item.str)
-          .join(' ');
-        
-        fullText += pageText + '\n\n';
-      }
+      // Extract text from all pages concurrently; results keep page order
+      const pageTexts = await Promise.all(
+        Array.from({ length: numPages }, async (_, index) => {
+          const page = await pdf.getPage(index + 1);
+          const textContent = await page.getTextContent();
+          
+          // Combine text items into a single string
+          return textContent.items
+            .map(item => item.str)
+            .join(' ');
+        })
+      );
+      
+      const fullText = pageTexts.map(pageText => pageText + '\n\n').join('');
       
       if (!fullText.trim()) {
         throw new Error('No text could be extracted from the PDF. The file may contain scanned images instead of text.');
@@ -117,21 +127,17 @@ export class FileToTextConverter {
 
   extractTextFromDocumentXML(xmlContent) {
     // Basic text extraction from document.xml
-    // This extracts text from <w:t> tags
-    const textMatches = xmlContent.match(/<w:t[^>]*>([^<]+)<\/w:t>/g) || [];
+    // This extracts text from <w:t> tags, capturing the run text in the same pass
+    const textRuns = [];
+    for (const match of xmlContent.matchAll(/<w:t[^>]*>([^<]+)<\/w:t>/g)) {
+      textRuns.push(match[1]);
+    }
     
-    const extractedText = textMatches
-      .map(match => {
-        // Extract text between tags
-        const text = match.replace(/<[^>]+>/g, '');
-        return text;
-      })
-      .join(' ');
+    const extractedText = textRuns.join(' ');
     
-    // Clean up excessive whitespace
+    // Collapse whitespace runs (newlines included) in one pass
     return extractedText
       .replace(/\s+/g, ' ')
-      .replace(/\s*\n\s*/g, '\n')
       .trim();
   }
 }
\ No newline at end of file
@@ -270,20 +270,20 @@ export class FileToTextConverter {
         console.log(`[FileToTextConverter] PDF loaded: ${pdf.numPages} pages`);
       }
 
-      let fullText = '';
-
-      // Extract text from each page
-      for (let pageNum = 1; pageNum <= pdf.numPages; pageNum++) {
-        const page = await pdf.getPage(pageNum);
-        const textContent = await page.getTextContent();
-        
-        // Concatenate text items
-        const pageText = textContent.items
-          .map((item: any) => item.str)
-          .join(' ');
-        
-        fullText += pageText + '\n';
-      }
+      // Extract text from all pages concurrently; results keep page order
+      const pageTexts = await Promise.all(
+        Array.from({ length: pdf.numPages }, async (_, index) => {
+          const page = await pdf.getPage(index + 1);
+          const textContent = await page.getTextContent();
+          
+          // Concatenate text items
+          return textContent.items
+            .map((item: any) => item.str)
+            .join(' ');
+        })
+      );
+
+      const fullText = pageTexts.map(pageText => pageText + '\n').join('');
 
       return fullText.trim();
 
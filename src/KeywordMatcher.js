@@ -0,0 +1,93 @@
+/**
+ * Multi-keyword substring matcher (Aho-Corasick automaton)
+ * Finds every keyword contained in a text in a single pass,
+ * instead of one includes() scan per keyword
+ */
+
+export class KeywordMatcher {
+  constructor(keywords) {
+    this.keywords = [...keywords];
+
+    // State 0 is the root; each state has its transitions, failure link and matched keywords
+    this.transitions = [new Map()];
+    this.failure = [0];
+    this.outputs = [[]];
+
+    this.keywords.forEach((keyword, index) => this.addKeyword(keyword, index));
+    this.buildFailureLinks();
+  }
+
+  /**
+   * Add a keyword to the trie
+   */
+  addKeyword(keyword, index) {
+    if (!keyword) {
+      return;
+    }
+
+    let state = 0;
+
+    for (const char of keyword) {
+      let next = this.transitions[state].get(char);
+
+      if (next === undefined) {
+        next = this.transitions.length;
+        this.transitions.push(new Map());
+        this.failure.push(0);
+        this.outputs.push([]);
+        this.transitions[state].set(char, next);
+      }
+
+      state = next;
+    }
+
+    this.outputs[state].push(index);
+  }
+
+  /**
+   * Link every state to its longest proper suffix in the trie (breadth-first)
+   */
+  buildFailureLinks() {
+    const queue = [...this.transitions[0].values()];
+
+    for (let i = 0; i < queue.length; i++) {
+      const state = queue[i];
+
+      for (const [char, next] of this.transitions[state]) {
+        let fallback = this.failure[state];
+        while (fallback !== 0 && !this.transitions[fallback].has(char)) {
+          fallback = this.failure[fallback];
+        }
+
+        const target = this.transitions[fallback].get(char);
+        this.failure[next] = target !== undefined && target !== next ? target : 0;
+
+        // Keywords ending at the suffix state also end here
+        this.outputs[next] = this.outputs[next].concat(this.outputs[this.failure[next]]);
+        queue.push(next);
+      }
+    }
+  }
+
+  /**
+   * Return the set of keywords contained in text (case-sensitive)
+   */
+  findAll(text) {
+    const found = new Set();
+    let state = 0;
+
+    for (const char of text) {
+      while (state !== 0 && !this.transitions[state].has(char)) {
+        state = this.failure[state];
+      }
+
+      state = this.transitions[state].get(char) ?? 0;
+
+      for (const index of this.outputs[state]) {
+        found.add(this.keywords[index]);
+      }
+    }
+
+    return found;
+  }
+}
@@ -1,18 +1,24 @@
 import { AddressDetectionService } from './AddressDetectionService.js';
+import { ADDRESS_REPLACEMENT_TAGS, EMAIL_REGEX, PHONE_REGEX, SSN_REGEX } from './PIIRedactor.js';
+
+// Non-global copies for single-token checks; test() on a /g regex carries lastIndex between calls
+const EMAIL_TEST_REGEX = new RegExp(EMAIL_REGEX.source);
+const PHONE_TEST_REGEX = new RegExp(PHONE_REGEX.source);
+const SSN_TEST_REGEX = new RegExp(SSN_REGEX.source);
 
 export class ManualRedactor {
-  constructor() {
+  constructor(addressService = AddressDetectionService.getShared()) {
     this.undoHistory = [];
     this.redoHistory = [];
     this.maxHistoryLength = 10;
     
     // Reuse PII patterns from PIIRedactor
-    this.emailRegex = /\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b/g;
-    this.phoneRegex = /(\(\d{3}\)\s\d{3}-\d{4}|\d{3}-\d{3}-\d{4}|\d{10})/g;
-    this.ssnRegex = /\b\d{3}-\d{2}-\d{4}\b/g;
+    this.emailRegex = EMAIL_REGEX;
+    this.phoneRegex = PHONE_REGEX;
+    this.ssnRegex = SSN_REGEX;
     
-    // Initialize address detection service
-    this.addressService = new AddressDetectionService();
+    // Address detection service (shared by default; pass one in to use a separate instance)
+    this.addressService = addressService;
   }
 
   tokenize(text) {
@@ -27,6 +33,7 @@ export class ManualRedactor {
     // Add traditional PII patterns
     for (const pattern of piiPatterns) {
       let match;
+      pattern.lastIndex = 0; // Shared /g regex: don't resume from another caller's position
       while ((match = pattern.exec(text)) !== null) {
         piiMatches.push({
           start: match.index,
@@ -128,20 +135,15 @@ export class ManualRedactor {
         token.isAutoDetected = true;
       } else {
         // Check for any remaining PII that wasn't caught
-        if (this.emailRegex.test(token.text) || 
-            this.phoneRegex.test(token.text) || 
-            this.ssnRegex.test(token.text)) {
+        if (EMAIL_TEST_REGEX.test(token.text) || 
+            PHONE_TEST_REGEX.test(token.text) || 
+            SSN_TEST_REGEX.test(token.text)) {
           token.isAutoDetected = true;
           token.piiType = 'traditional_pii';
         }
       }
     }
     
-    // Reset regex lastIndex to avoid issues with global flags
-    this.emailRegex.lastIndex = 0;
-    this.phoneRegex.lastIndex = 0;
-    this.ssnRegex.lastIndex = 0;
-    
     return tokens;
   }
 
@@ -163,28 +165,19 @@ export class ManualRedactor {
       if (token.isAutoDetected) {
         // Handle address types
         if (token.piiType === 'address') {
-          switch (token.addressType) {
-            case 'full_address':
-              return '[ADDRESS_REDACTED]';
-            case 'partial_address':
-              return '[PARTIAL_ADDRESS_REDACTED]';
-            case 'po_box':
-              return '[PO_BOX_REDACTED]';
-            case 'international_address':
-              return '[INTERNATIONAL_ADDRESS_REDACTED]';
-            default:
-              return '[ADDRESS_REDACTED]';
-          }
+          return Object.hasOwn(ADDRESS_REPLACEMENT_TAGS, token.addressType)
+            ? ADDRESS_REPLACEMENT_TAGS[token.addressType]
+            : '[ADDRESS_REDACTED]';
         }
         
         // Handle traditional PII
-        if (this.emailRegex.test(token.text)) {
+        if (EMAIL_TEST_REGEX.test(token.text)) {
           return '[EMAIL_REDACTED]';
         }
-        if (this.phoneRegex.test(token.text)) {
+        if (PHONE_TEST_REGEX.test(token.text)) {
           return '[PHONE_REDACTED]';
         }
-        if (this.ssnRegex.test(token.text)) {
+        if (SSN_TEST_REGEX.test(token.text)) {
           return '[SSN_REDACTED]';
         }
       }
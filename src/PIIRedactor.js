@@ -1,14 +1,26 @@
 import { AddressDetectionService } from './AddressDetectionService.js';
 
+// US format regex patterns as specified, compiled once and shared with ManualRedactor
+export const EMAIL_REGEX = /\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b/g;
+export const PHONE_REGEX = /(\(\d{3}\)\s\d{3}-\d{4}|\d{3}-\d{3}-\d{4}|\d{10})/g;
+export const SSN_REGEX = /\b\d{3}-\d{2}-\d{4}\b/g;
+
+// Replacement tag per detected address type; unknown types fall back to the generic tag
+export const ADDRESS_REPLACEMENT_TAGS = {
+  full_address: '[ADDRESS_REDACTED]',
+  partial_address: '[PARTIAL_ADDRESS_REDACTED]',
+  po_box: '[PO_BOX_REDACTED]',
+  international_address: '[INTERNATIONAL_ADDRESS_REDACTED]'
+};
+
 export class PIIRedactor {
-  constructor() {
-    // US format regex patterns as specified
-    this.emailRegex = /\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b/g;
-    this.phoneRegex = /(\(\d{3}\)\s\d{3}-\d{4}|\d{3}-\d{3}-\d{4}|\d{10})/g;
-    this.ssnRegex = /\b\d{3}-\d{2}-\d{4}\b/g;
+  constructor(addressService = AddressDetectionService.getShared()) {
+    this.emailRegex = EMAIL_REGEX;
+    this.phoneRegex = PHONE_REGEX;
+    this.ssnRegex = SSN_REGEX;
     
-    // Initialize address detection service
-    this.addressService = new AddressDetectionService();
+    // Address detection service (shared by default; pass one in to use a separate instance)
+    this.addressService = addressService;
   }
 
   redact(text) {
@@ -31,11 +43,31 @@ export class PIIRedactor {
 
   redactAddresses(text) {
     const addresses = this.addressService.detectAddresses(text);
-    let redactedText = text;
     
     // Sort addresses by start index in reverse order to avoid index shifting
     addresses.sort((a, b) => b.startIndex - a.startIndex);
     
+    // Collect the kept text and tags back to front and join once, instead of
+    // rebuilding the whole string for every address
+    const parts = [];
+    let cursor = text.length;
+    
+    for (const address of addresses) {
+      if (address.endIndex > cursor) {
+        // Overlapping detections: keep the original in-place slicing semantics
+        return this.redactAddressesInPlace(text, addresses);
+      }
+      parts.push(text.slice(address.endIndex, cursor), this.getAddressReplacementTag(address.type));
+      cursor = address.startIndex;
+    }
+    
+    parts.push(text.slice(0, cursor));
+    return parts.reverse().join('');
+  }
+
+  redactAddressesInPlace(text, addresses) {
+    let redactedText = text;
+    
     for (const address of addresses) {
       const replacement = this.getAddressReplacementTag(address.type);
       redactedText = redactedText.slice(0, address.startIndex) + 
@@ -47,18 +79,9 @@ export class PIIRedactor {
   }
 
   getAddressReplacementTag(addressType) {
-    switch (addressType) {
-      case 'full_address':
-        return '[ADDRESS_REDACTED]';
-      case 'partial_address':
-        return '[PARTIAL_ADDRESS_REDACTED]';
-      case 'po_box':
-        return '[PO_BOX_REDACTED]';
-      case 'international_address':
-        return '[INTERNATIONAL_ADDRESS_REDACTED]';
-      default:
-        return '[ADDRESS_REDACTED]';
-    }
+    return Object.hasOwn(ADDRESS_REPLACEMENT_TAGS, addressType)
+      ? ADDRESS_REPLACEMENT_TAGS[addressType]
+      : '[ADDRESS_REDACTED]';
   }
 
   // Method to get detected addresses for manual redaction
@@ -2,15 +2,86 @@
  * Perplexity AI Service - Simple direct API integration
  */
 
+import { KeywordMatcher } from './KeywordMatcher.js';
+
+/**
+ * Static content of the fallback response, shared by every call
+ */
+const FALLBACK_SUGGESTIONS = Object.freeze([
+  '• AI-enhanced roles are becoming common across all industries',
+  '• Consider roles that combine your expertise with AI tools',
+  '• Look for positions mentioning AI analytics, automation, or intelligent systems',
+  '• Many companies are seeking professionals who can bridge traditional skills with AI'
+]);
+
+const FALLBACK_INDUSTRIES = Object.freeze(['Technology', 'Consulting', 'Finance', 'Healthcare']);
+
+/**
+ * Role-extraction patterns, checked in priority order
+ */
+const ROLE_PATTERNS = [
+  /(?:current|present|now)\s+(?:position|role|job|title):\s*([^\.]+)/i,
+  /(?:software|web|mobile|frontend|backend|full[\s-]?stack)\s+(?:engineer|developer|programmer)/i,
+  /(?:data|business|financial|marketing|sales|project|product|operations)\s+(?:analyst|manager|specialist|coordinator)/i,
+  /(?:accountant|accounting|bookkeeper|cpa)/i,
+  /(?:teacher|educator|instructor|professor)/i,
+  /(?:nurse|doctor|physician|healthcare|medical)/i,
+  /(?:designer|artist|creative|ux|ui)/i,
+  /(?:consultant|advisor|specialist)/i
+];
+
+const JOB_TITLES = [
+  'software engineer', 'web developer', 'data analyst', 'project manager',
+  'business analyst', 'accountant', 'sales manager', 'marketing specialist',
+  'teacher', 'nurse', 'designer', 'consultant'
+];
+
+const JOB_TITLE_MATCHER = new KeywordMatcher(JOB_TITLES);
+
+/**
+ * Industry keywords, matched against the resume and skills in one pass each
+ */
+const INDUSTRY_MAP = {
+  'technology': ['software', 'programming', 'development', 'tech', 'it', 'computer'],
+  'healthcare': ['medical', 'hospital', 'nurse', 'doctor', 'patient', 'clinical'],
+  'finance': ['bank', 'financial', 'accounting', 'investment', 'insurance', 'audit'],
+  'education': ['school', 'university', 'teaching', 'student', 'academic', 'curriculum'],
+  'retail': ['sales', 'customer', 'store', 'merchandise', 'retail', 'commerce'],
+  'manufacturing': ['production', 'manufacturing', 'operations', 'supply chain', 'quality'],
+  'consulting': ['consulting', 'advisory', 'client', 'strategy', 'solutions']
+};
+
+const INDUSTRY_ENTRIES = Object.entries(INDUSTRY_MAP);
+const INDUSTRY_MATCHER = new KeywordMatcher(INDUSTRY_ENTRIES.flatMap(([, keywords]) => keywords));
+
 export class PerplexityService {
   constructor() {
     this.apiUrl = 'https://api.perplexity.ai/chat/completions';
     this.apiKey = process.env.PERPLEXITY_API_KEY || '';
     this.rateLimit = 20;
     this.timeout = 15000;
+    this.requestHeaders = {
+      'Authorization': `Bearer ${this.apiKey}`,
+      'Content-Type': 'application/json'
+    };
+    
+    // Token bucket: bursts of up to rateLimit requests, refilled at rateLimit per minute
+    this.rateLimitTokens = this.rateLimit;
+    this.rateLimitRefilledAt = performance.now();
     
-    this.requestCount = 0;
-    this.lastReset = Date.now();
+    // Circuit breaker: stop calling the API after repeated upstream failures
+    this.breakerThreshold = 5;
+    this.breakerResetTimeout = 30000;
+    this.consecutiveFailures = 0;
+    this.breakerOpenedAt = null;
+    this.breakerTrialInFlight = false;
+    
+    // Recent responses and in-flight requests, keyed by the query sent
+    this.responseCacheTTL = 5 * 60 * 1000;
+    this.responseCacheLimit = 50;
+    this.responseCacheStorageKey = 'perplexityResponseCache';
+    this.responseCache = this.loadResponseCache();
+    this.inflightRequests = new Map();
     
     console.log('🧠 Perplexity Service initialized');
   }
@@ -18,68 +89,35 @@ export class PerplexityService {
   /**
    * Extract primary role from resume text
    */
-  extractPrimaryRole(resumeText) {
-    const lowerText = resumeText.toLowerCase();
-    
-    const rolePatterns = [
-      /(?:current|present|now)\s+(?:position|role|job|title):\s*([^\.]+)/i,
-      /(?:software|web|mobile|frontend|backend|full[\s-]?stack)\s+(?:engineer|developer|programmer)/i,
-      /(?:data|business|financial|marketing|sales|project|product|operations)\s+(?:analyst|manager|specialist|coordinator)/i,
-      /(?:accountant|accounting|bookkeeper|cpa)/i,
-      /(?:teacher|educator|instructor|professor)/i,
-      /(?:nurse|doctor|physician|healthcare|medical)/i,
-      /(?:designer|artist|creative|ux|ui)/i,
-      /(?:consultant|advisor|specialist)/i
-    ];
-    
-    for (const pattern of rolePatterns) {
+  extractPrimaryRole(resumeText, lowerText = resumeText.toLowerCase()) {
+    for (const pattern of ROLE_PATTERNS) {
       const match = lowerText.match(pattern);
       if (match) {
         return match[0].replace(/^\w+\s+/, '').trim();
       }
     }
     
-    const jobTitles = [
-      'software engineer', 'web developer', 'data analyst', 'project manager',
-      'business analyst', 'accountant', 'sales manager', 'marketing specialist',
-      'teacher', 'nurse', 'designer', 'consultant'
-    ];
-    
-    for (const title of jobTitles) {
-      if (lowerText.includes(title)) {
-        return title;
-      }
-    }
-    
-    return 'professional';
+    // Scan for every title at once, then keep the list's priority order
+    const foundTitles = JOB_TITLE_MATCHER.findAll(lowerText);
+    return JOB_TITLES.find(title => foundTitles.has(title)) || 'professional';
   }
 
   /**
    * Identify relevant industries from resume and skills
    */
-  identifyIndustries(resumeText, skills) {
+  identifyIndustries(resumeText, skills, lowerText = resumeText.toLowerCase()) {
     const industries = [];
-    const lowerText = resumeText.toLowerCase();
-    
-    const industryMap = {
-      'technology': ['software', 'programming', 'development', 'tech', 'it', 'computer'],
-      'healthcare': ['medical', 'hospital', 'nurse', 'doctor', 'patient', 'clinical'],
-      'finance': ['bank', 'financial', 'accounting', 'investment', 'insurance', 'audit'],
-      'education': ['school', 'university', 'teaching', 'student', 'academic', 'curriculum'],
-      'retail': ['sales', 'customer', 'store', 'merchandise', 'retail', 'commerce'],
-      'manufacturing': ['production', 'manufacturing', 'operations', 'supply chain', 'quality'],
-      'consulting': ['consulting', 'advisory', 'client', 'strategy', 'solutions']
-    };
+    const textKeywords = INDUSTRY_MATCHER.findAll(lowerText);
+    const skillKeywords = INDUSTRY_MATCHER.findAll(skills.join(' ').toLowerCase());
     
-    for (const [industry, keywords] of Object.entries(industryMap)) {
-      if (keywords.some(keyword => lowerText.includes(keyword))) {
+    for (const [industry, keywords] of INDUSTRY_ENTRIES) {
+      if (keywords.some(keyword => textKeywords.has(keyword))) {
         industries.push(industry);
       }
     }
     
-    const skillsText = skills.join(' ').toLowerCase();
-    for (const [industry, keywords] of Object.entries(industryMap)) {
-      if (keywords.some(keyword => skillsText.includes(keyword))) {
+    for (const [industry, keywords] of INDUSTRY_ENTRIES) {
+      if (keywords.some(keyword => skillKeywords.has(keyword))) {
         if (!industries.includes(industry)) {
           industries.push(industry);
         }
@@ -126,20 +164,195 @@ export class PerplexityService {
   }
 
   /**
-   * Check rate limits
+   * Check rate limits and take a token for the request about to be sent
    */
   checkRateLimit() {
-    const now = Date.now();
-    const timeSinceReset = now - this.lastReset;
+    // performance.now() is monotonic, so clock adjustments cannot refill or drain the bucket
+    const now = performance.now();
+    const refill = (now - this.rateLimitRefilledAt) * this.rateLimit / 60000;
+    this.rateLimitTokens = Math.min(this.rateLimit, this.rateLimitTokens + refill);
+    this.rateLimitRefilledAt = now;
     
-    if (timeSinceReset > 60000) {
-      this.requestCount = 0;
-      this.lastReset = now;
+    if (this.rateLimitTokens < 1) {
+      const waitTime = (1 - this.rateLimitTokens) * 60000 / this.rateLimit;
+      throw new Error(`Rate limit exceeded. Please wait ${Math.ceil(waitTime / 1000)} seconds.`);
     }
     
-    if (this.requestCount >= this.rateLimit) {
-      const waitTime = 60000 - timeSinceReset;
-      throw new Error(`Rate limit exceeded. Please wait ${Math.ceil(waitTime / 1000)} seconds.`);
+    this.rateLimitTokens -= 1;
+  }
+
+  /**
+   * Check circuit breaker state
+   */
+  checkCircuitBreaker() {
+    // Half-open: only the trial request may reach the API until it settles
+    if (this.breakerTrialInFlight) {
+      throw new Error('Perplexity API temporarily unavailable. Please try again in a few seconds.');
+    }
+    
+    if (this.breakerOpenedAt === null) {
+      return;
+    }
+    
+    const timeSinceOpen = Date.now() - this.breakerOpenedAt;
+    
+    if (timeSinceOpen < this.breakerResetTimeout) {
+      const waitTime = this.breakerResetTimeout - timeSinceOpen;
+      throw new Error(`Perplexity API temporarily unavailable. Please wait ${Math.ceil(waitTime / 1000)} seconds.`);
+    }
+    
+    // Reset timeout elapsed: this request becomes the trial once fetchPerplexity starts it
+  }
+
+  /**
+   * Record the outcome of an upstream call for the circuit breaker
+   */
+  recordUpstreamResult(succeeded) {
+    if (this.breakerTrialInFlight) {
+      this.breakerTrialInFlight = false;
+      
+      // A failed trial re-opens the breaker straight away
+      if (!succeeded) {
+        this.breakerOpenedAt = Date.now();
+        return;
+      }
+    }
+    
+    if (succeeded) {
+      this.consecutiveFailures = 0;
+      return;
+    }
+    
+    this.consecutiveFailures++;
+    if (this.consecutiveFailures >= this.breakerThreshold) {
+      this.breakerOpenedAt = Date.now();
+    }
+  }
+
+  /**
+   * POST the query to Perplexity, bounded by the request timeout
+   */
+  async fetchPerplexity(query) {
+    let response;
+    
+    // Past the reset timeout: close the breaker and mark this call as the half-open trial
+    if (this.breakerOpenedAt !== null) {
+      this.breakerOpenedAt = null;
+      this.breakerTrialInFlight = true;
+    }
+    
+    try {
+      response = await fetch(this.apiUrl, {
+        method: 'POST',
+        headers: this.requestHeaders,
+        body: JSON.stringify(query),
+        signal: AbortSignal.timeout(this.timeout)
+      });
+    } catch (error) {
+      this.recordUpstreamResult(false);
+      if (error.name === 'TimeoutError') {
+        throw new Error(`Perplexity API timed out after ${this.timeout / 1000} seconds`);
+      }
+      throw error;
+    }
+    
+    if (!response.ok) {
+      // Server errors and throttling (429) count as failures so the breaker backs off;
+      // other client errors mean the API itself is up
+      this.recordUpstreamResult(response.status < 500 && response.status !== 429);
+      throw new Error(`Perplexity API error: ${response.status} ${response.statusText}`);
+    }
+    
+    this.recordUpstreamResult(true);
+    return response.json();
+  }
+
+  /**
+   * Send a query, reusing a recent response or an identical in-flight request.
+   * Async so breaker and rate-limit errors reject like upstream failures do.
+   */
+  async requestPerplexity(query) {
+    const cacheKey = JSON.stringify(query);
+    
+    const cached = this.responseCache.get(cacheKey);
+    if (cached) {
+      this.responseCache.delete(cacheKey);
+      if (Date.now() - cached.timestamp < this.responseCacheTTL) {
+        // Re-insert to mark as most recently used
+        this.responseCache.set(cacheKey, cached);
+        return cached.data;
+      }
+    }
+    
+    const inflight = this.inflightRequests.get(cacheKey);
+    if (inflight) {
+      return inflight;
+    }
+    
+    this.checkCircuitBreaker();
+    this.checkRateLimit();
+    
+    const request = this.fetchPerplexity(query)
+      .then((data) => {
+        this.cacheResponse(cacheKey, data);
+        return data;
+      })
+      .finally(() => {
+        this.inflightRequests.delete(cacheKey);
+      });
+    
+    this.inflightRequests.set(cacheKey, request);
+    return request;
+  }
+
+  /**
+   * Store a response, evicting the least recently used entries past the limit
+   */
+  cacheResponse(cacheKey, data) {
+    this.responseCache.set(cacheKey, { data, timestamp: Date.now() });
+    
+    while (this.responseCache.size > this.responseCacheLimit) {
+      this.responseCache.delete(this.responseCache.keys().next().value);
+    }
+    
+    this.saveResponseCache();
+  }
+
+  /**
+   * Restore unexpired responses saved earlier in this browser session
+   */
+  loadResponseCache() {
+    const cache = new Map();
+    
+    try {
+      if (typeof sessionStorage === 'undefined') {
+        return cache;
+      }
+      
+      const stored = JSON.parse(sessionStorage.getItem(this.responseCacheStorageKey) || '[]');
+      const now = Date.now();
+      for (const [cacheKey, entry] of stored) {
+        if (now - entry.timestamp < this.responseCacheTTL) {
+          cache.set(cacheKey, entry);
+        }
+      }
+    } catch (error) {
+      console.warn('Ignoring unreadable Perplexity response cache:', error);
+    }
+    
+    return cache;
+  }
+
+  /**
+   * Persist the response cache so a page reload can reuse it
+   */
+  saveResponseCache() {
+    try {
+      if (typeof sessionStorage !== 'undefined') {
+        sessionStorage.setItem(this.responseCacheStorageKey, JSON.stringify([...this.responseCache]));
+      }
+    } catch (error) {
+      // Storage full or unavailable; the in-memory cache still works
     }
   }
 
@@ -148,15 +361,14 @@ export class PerplexityService {
    */
   async queryPerplexity(resumeText, skills, statusCallback = null) {
     try {
-      this.checkRateLimit();
-      this.requestCount++;
-      
       if (statusCallback) {
         statusCallback('🔄 Analyzing your profile...');
       }
       
-      const primaryRole = this.extractPrimaryRole(resumeText);
-      const industries = this.identifyIndustries(resumeText, skills);
+      // Both extractors work on the lowercased resume; build it once
+      const lowerText = resumeText.toLowerCase();
+      const primaryRole = this.extractPrimaryRole(resumeText, lowerText);
+      const industries = this.identifyIndustries(resumeText, skills, lowerText);
       
       if (statusCallback) {
         statusCallback(`👤 Role: ${primaryRole} | Industries: ${industries.join(', ')}`);
@@ -168,21 +380,7 @@ export class PerplexityService {
         statusCallback('🌐 Searching job market...');
       }
       
-      const response = await fetch(this.apiUrl, {
-        method: 'POST',
-        headers: {
-          'Authorization': `Bearer ${this.apiKey}`,
-          'Content-Type': 'application/json'
-        },
-        body: JSON.stringify(query),
-        signal: AbortSignal.timeout(this.timeout)
-      });
-      
-      if (!response.ok) {
-        throw new Error(`Perplexity API error: ${response.status} ${response.statusText}`);
-      }
-      
-      const data = await response.json();
+      const data = await this.requestPerplexity(query);
       
       if (statusCallback) {
         statusCallback('✅ Processing results...');
@@ -224,25 +422,35 @@ export class PerplexityService {
   parseJobResults(data) {
     try {
       const content = data.choices[0].message.content;
+      const trimmed = content.trim();
       
-      // Try to parse JSON from response
-      try {
-        const parsedContent = JSON.parse(content);
-        if (parsedContent.jobMatches && Array.isArray(parsedContent.jobMatches)) {
-          return parsedContent.jobMatches;
+      // Plain JSON: parse directly, without paying for a thrown SyntaxError on other formats
+      if (trimmed.startsWith('{')) {
+        try {
+          return this.getJobMatches(JSON.parse(trimmed));
+        } catch (directParseError) {
+          // Fall through to the embedded formats below
         }
-      } catch (directParseError) {
-        // Try markdown JSON block format
-        const jsonMatch = content.match(/```json\n([\s\S]*?)\n```/);
-        if (jsonMatch) {
-          try {
-            const parsedMarkdownJson = JSON.parse(jsonMatch[1]);
-            if (parsedMarkdownJson.jobMatches && Array.isArray(parsedMarkdownJson.jobMatches)) {
-              return parsedMarkdownJson.jobMatches;
-            }
-          } catch (markdownParseError) {
-            console.error('Failed to parse markdown JSON:', markdownParseError);
-          }
+      }
+      
+      // Try markdown JSON block format
+      const jsonMatch = content.match(/```json\n([\s\S]*?)\n```/);
+      if (jsonMatch) {
+        try {
+          return this.getJobMatches(JSON.parse(jsonMatch[1]));
+        } catch (markdownParseError) {
+          console.error('Failed to parse markdown JSON:', markdownParseError);
+        }
+      }
+      
+      // JSON object with prose before and/or after it: hand the outermost braces to the native parser
+      const jsonStart = content.indexOf('{');
+      const jsonEnd = content.lastIndexOf('}');
+      if (jsonStart !== -1 && jsonEnd > jsonStart) {
+        try {
+          return this.getJobMatches(JSON.parse(content.slice(jsonStart, jsonEnd + 1)));
+        } catch (embeddedParseError) {
+          // Not JSON after all
         }
       }
       
@@ -253,19 +461,24 @@ export class PerplexityService {
     }
   }
 
+  /**
+   * Pull the jobMatches array out of a parsed response
+   */
+  getJobMatches(parsedContent) {
+    if (parsedContent && Array.isArray(parsedContent.jobMatches)) {
+      return parsedContent.jobMatches;
+    }
+    return [];
+  }
+
   /**
    * Provide fallback response when Perplexity is unavailable
    */
   getFallbackResponse(primaryRole) {
     return {
       message: `Perplexity AI is currently unavailable. Here's what we know about ${primaryRole} roles:`,
-      suggestions: [
-        '• AI-enhanced roles are becoming common across all industries',
-        '• Consider roles that combine your expertise with AI tools',
-        '• Look for positions mentioning AI analytics, automation, or intelligent systems',
-        '• Many companies are seeking professionals who can bridge traditional skills with AI'
-      ],
-      industries: ['Technology', 'Consulting', 'Finance', 'Healthcare'],
+      suggestions: FALLBACK_SUGGESTIONS,
+      industries: FALLBACK_INDUSTRIES,
       note: 'This is a fallback response. Try again later for live job market data.'
     };
   }
@@ -4,6 +4,8 @@
  * Uses O*NET 2025 data patterns for future-ready role suggestions
  */
 
+import { KeywordMatcher } from './KeywordMatcher.js';
+
 /**
  * O*NET 2025 AI-Enhanced Career Mapping Database
  * Based on emerging AI integration patterns in traditional roles
@@ -41,14 +43,60 @@ const ONET_AI_ENHANCED_MAPPINGS = {
   'education': { enhanced: 'personalized AI learning facilitation', baseScore: 81 }
 };
 
+const HIGH_DEMAND_KEYWORDS = ['ai', 'machine learning', 'data', 'automation', 'intelligence'];
+
+/**
+ * Deterministic part of the amplification score: baseScore + relevanceBonus + futureReadinessBonus
+ */
+function calculateStaticScore(mapping) {
+  // Relevance bonus for high-demand AI skills
+  const enhancedLower = mapping.enhanced.toLowerCase();
+  const relevanceBonus = HIGH_DEMAND_KEYWORDS.some(keyword => 
+    enhancedLower.includes(keyword)
+  ) ? 10 : 0;
+
+  // Future readiness bonus for emerging tech integration
+  const futureReadinessBonus = mapping.enhanced.includes('AI') ? 8 : 5;
+
+  return mapping.baseScore + relevanceBonus + futureReadinessBonus;
+}
+
+/**
+ * Static scores only depend on the mapping table, so evaluate them once at load
+ */
+const STATIC_SCORES = new Map(
+  Object.values(ONET_AI_ENHANCED_MAPPINGS).map(mapping => [mapping, calculateStaticScore(mapping)])
+);
+
+/**
+ * Keywords recognized when extracting skills from free text
+ */
+const SKILL_KEYWORDS = [
+  'javascript', 'python', 'java', 'react', 'node', 'sql', 'excel', 'powerpoint',
+  'communication', 'leadership', 'teamwork', 'project management', 'customer service',
+  'data analysis', 'marketing', 'sales', 'accounting', 'research', 'writing',
+  'graphic design', 'web development', 'database', 'programming'
+];
+
+const SKILL_MATCHER = new KeywordMatcher(SKILL_KEYWORDS);
+
+/**
+ * Data sources cited with every analysis result
+ */
+const ANALYSIS_SOURCES = Object.freeze([
+  'O*NET 2025 AI Enhancement Database',
+  'Bureau of Labor Statistics Future Skills Report',
+  'World Economic Forum AI Career Trends'
+]);
+
 export class SkillAnalysisService {
   constructor() {
     this.onetMappings = ONET_AI_ENHANCED_MAPPINGS;
-    this.sources = [
-      'O*NET 2025 AI Enhancement Database',
-      'Bureau of Labor Statistics Future Skills Report',
-      'World Economic Forum AI Career Trends'
-    ];
+    this.mappingEntries = Object.entries(this.onetMappings);
+    this.sources = ANALYSIS_SOURCES;
+    
+    // Normalized form and mapping per raw skill string (both are pure lookups)
+    this.skillCache = new Map();
   }
 
   /**
@@ -64,10 +112,16 @@ export class SkillAnalysisService {
     }
 
     const mappedSkills = [];
+    const seenSkills = new Set();
 
     for (const skill of skills) {
-      const normalizedSkill = this.normalizeSkill(skill);
-      const mapping = this.findAIEnhancedMapping(normalizedSkill);
+      const { normalizedSkill, mapping } = this.resolveSkill(skill);
+      
+      // The same skill listed twice (e.g. "Python" and "python") is scored once
+      if (seenSkills.has(normalizedSkill)) {
+        continue;
+      }
+      seenSkills.add(normalizedSkill);
       
       if (mapping) {
         const score = this.calculateAmplificationScore(normalizedSkill, mapping);
@@ -88,6 +142,21 @@ export class SkillAnalysisService {
     };
   }
 
+  /**
+   * Normalize a skill and find its mapping, cached per raw skill string
+   */
+  resolveSkill(skill) {
+    let resolved = this.skillCache.get(skill);
+
+    if (!resolved) {
+      const normalizedSkill = this.normalizeSkill(skill);
+      resolved = { normalizedSkill, mapping: this.findAIEnhancedMapping(normalizedSkill) };
+      this.skillCache.set(skill, resolved);
+    }
+
+    return resolved;
+  }
+
   /**
    * Normalize skill text for better matching
    */
@@ -108,7 +177,7 @@ export class SkillAnalysisService {
     }
 
     // Fuzzy matching for partial matches
-    for (const [key, mapping] of Object.entries(this.onetMappings)) {
+    for (const [key, mapping] of this.mappingEntries) {
       if (normalizedSkill.includes(key) || key.includes(normalizedSkill)) {
         return mapping;
       }
@@ -130,43 +199,25 @@ export class SkillAnalysisService {
    * Formula: (baseScore + relevanceBonus + futureReadinessBonus) with randomization for diversity
    */
   calculateAmplificationScore(skill, mapping) {
-    let score = mapping.baseScore;
-
-    // Relevance bonus for high-demand AI skills
-    const highDemandKeywords = ['ai', 'machine learning', 'data', 'automation', 'intelligence'];
-    const relevanceBonus = highDemandKeywords.some(keyword => 
-      mapping.enhanced.toLowerCase().includes(keyword)
-    ) ? 10 : 0;
-
-    // Future readiness bonus for emerging tech integration
-    const futureReadinessBonus = mapping.enhanced.includes('AI') ? 8 : 5;
+    const staticScore = STATIC_SCORES.get(mapping) ?? calculateStaticScore(mapping);
 
     // Small randomization for diversity in scoring (±5 points)
     const diversityFactor = Math.floor(Math.random() * 11) - 5;
 
-    return score + relevanceBonus + futureReadinessBonus + diversityFactor;
+    return staticScore + diversityFactor;
   }
 
   /**
    * Extract skills from text (helper method for integration)
    */
   extractSkillsFromText(text) {
-    const skillKeywords = [
-      'javascript', 'python', 'java', 'react', 'node', 'sql', 'excel', 'powerpoint',
-      'communication', 'leadership', 'teamwork', 'project management', 'customer service',
-      'data analysis', 'marketing', 'sales', 'accounting', 'research', 'writing',
-      'graphic design', 'web development', 'database', 'programming'
-    ];
-
-    const foundSkills = [];
-    const lowerText = text.toLowerCase();
-
-    for (const keyword of skillKeywords) {
-      if (lowerText.includes(keyword)) {
-        foundSkills.push(keyword);
-      }
+    // Fully redacted or blank documents have nothing to scan
+    if (!text || !/\S/.test(text)) {
+      return [];
     }
 
-    return [...new Set(foundSkills)]; // Remove duplicates
+    const found = SKILL_MATCHER.findAll(text.toLowerCase());
+
+    return SKILL_KEYWORDS.filter(keyword => found.has(keyword));
   }
 }
\ No newline at end of file
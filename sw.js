@@ -2,16 +2,30 @@
 const CACHE_NAME = 'career-ai-v1';
 const urlsToCache = [
   './examples/simple-upload.html',
-  './src/FileToTextConverter.js',
+  './dist/FileToTextConverter.esm.js',
   './src/CareerWizard.js',
   './src/wizard-styles.css',
   './manifest.json'
 ];
 
+// Open the cache once and reuse the handle for every install/fetch
+let cachePromise = null;
+
+function openCache() {
+  if (!cachePromise) {
+    cachePromise = caches.open(CACHE_NAME)
+      .catch((error) => {
+        cachePromise = null;
+        throw error;
+      });
+  }
+  return cachePromise;
+}
+
 // Install event
 self.addEventListener('install', (event) => {
   event.waitUntil(
-    caches.open(CACHE_NAME)
+    openCache()
       .then((cache) => {
         console.log('Service Worker: Cache opened');
         return cache.addAll(urlsToCache);
@@ -22,52 +36,84 @@ self.addEventListener('install', (event) => {
   );
 });
 
-// Fetch event with network-first strategy for dynamic content
+// Static assets that can be answered from cache while a fresh copy is fetched
+const staticDestinations = ['script', 'style', 'manifest'];
+
+// Fetch event: pages and static assets are served stale-while-revalidate, other content network-first
 self.addEventListener('fetch', (event) => {
   // Skip cross-origin requests
   if (!event.request.url.startsWith(self.location.origin)) {
     return;
   }
   
+  if (event.request.mode === 'navigate' || staticDestinations.includes(event.request.destination)) {
+    event.respondWith(staleWhileRevalidate(event));
+    return;
+  }
+  
   event.respondWith(
-    fetch(event.request)
-      .then((response) => {
-        // Check if we received a valid response
-        if (!response || response.status !== 200 || response.type !== 'basic') {
-          return response;
-        }
+    fetchAndCache(event.request)
+      .catch(() => offlineResponse(event.request))
+  );
+});
 
-        // Clone the response for caching
-        const responseToCache = response.clone();
+// Fetch from network and store valid same-origin responses in the cache
+function fetchAndCache(request) {
+  return fetch(request)
+    .then((response) => {
+      // Check if we received a valid response
+      if (!response || response.status !== 200 || response.type !== 'basic') {
+        return response;
+      }
 
-        caches.open(CACHE_NAME)
-          .then((cache) => {
-            cache.put(event.request, responseToCache);
-          });
+      // Clone the response for caching
+      const responseToCache = response.clone();
 
-        return response;
-      })
-      .catch(() => {
-        // If network fails, try to get from cache
-        return caches.match(event.request)
-          .then((cachedResponse) => {
-            if (cachedResponse) {
-              return cachedResponse;
-            }
-            
-            // If not in cache and it's a navigation request, return index page
-            if (event.request.mode === 'navigate') {
-              return caches.match('./examples/simple-upload.html');
-            }
-            
-            return new Response('Offline - Content not available', {
-              status: 503,
-              statusText: 'Service Unavailable'
-            });
-          });
-      })
-  );
-});
+      // Resolve only once the copy is stored, so waitUntil() covers the write;
+      // a failed write (e.g. quota) still hands back the network response
+      return openCache()
+        .then((cache) => cache.put(request, responseToCache))
+        .catch(() => {})
+        .then(() => response);
+    });
+}
+
+// Answer from cache right away and refresh the cached copy in the background
+function staleWhileRevalidate(event) {
+  const networkResponse = fetchAndCache(event.request);
+  
+  // Keep the worker alive until the background refresh has finished
+  event.waitUntil(networkResponse.catch(() => {}));
+  
+  return caches.match(event.request)
+    .then((cachedResponse) => {
+      if (cachedResponse) {
+        return cachedResponse;
+      }
+      
+      return networkResponse.catch(() => offlineResponse(event.request));
+    });
+}
+
+// If network fails, try to get from cache
+function offlineResponse(request) {
+  return caches.match(request)
+    .then((cachedResponse) => {
+      if (cachedResponse) {
+        return cachedResponse;
+      }
+      
+      // If not in cache and it's a navigation request, return index page
+      if (request.mode === 'navigate') {
+        return caches.match('./examples/simple-upload.html');
+      }
+      
+      return new Response('Offline - Content not available', {
+        status: 503,
+        statusText: 'Service Unavailable'
+      });
+    });
+}
 
 // Activate event
 self.addEventListener('activate', (event) => {